@@ -1,10 +1,12 @@
 from django.contrib import admin
 from django.contrib.admin import helpers
-from django.core.exceptions import PermissionDenied
-from django.db import transaction
+from django.core.exceptions import ImproperlyConfigured, PermissionDenied
 from django.template.response import TemplateResponse
 from django.utils.html import format_html
-from .safety import check_deletion_safety, log_deletion_attempt, log_deletion_success, SafetyError, safety
+from .safety import (
+    BatchDeletionError, check_deletion_safety, delete_in_batches, get_soft_delete_field, log_deletion_attempt, log_deletion_success,
+    soft_delete_model, soft_delete_queryset, SafetyError, safety
+)
 
 
 def delete_all_action(modeladmin, request, queryset):
@@ -12,14 +14,26 @@ def delete_all_action(modeladmin, request, queryset):
     Admin action to delete all objects of the selected model.
     """
     opts = modeladmin.model._meta
+    verbose_name = opts.verbose_name
+    verbose_name_plural = opts.verbose_name_plural
 
     # Check permissions
     if not modeladmin.has_delete_permission(request):
         raise PermissionDenied
 
-    # Get all objects for this model
-    all_objects = modeladmin.model.objects.all()
-    object_count = all_objects.count()
+    try:
+        soft_delete_field = get_soft_delete_field(modeladmin.model)
+    except ImproperlyConfigured as e:
+        from django.contrib import messages
+        messages.error(request, str(e))
+        return None
+
+    # Get all objects for this model (only rows not yet marked when soft deleting)
+    if soft_delete_field:
+        all_objects = soft_delete_queryset(modeladmin.model, soft_delete_field)
+    else:
+        all_objects = modeladmin.model.objects.all()
+    object_count = all_objects.order_by().count()
 
     # Safety checks
     try:
@@ -63,21 +77,49 @@ def delete_all_action(modeladmin, request, queryset):
         # Perform the deletion
         if object_count > 0:
             try:
-                with transaction.atomic():
-                    deleted_count, deleted_details = all_objects.delete()
+                if soft_delete_field:
+                    marked_count = soft_delete_model(modeladmin.model, soft_delete_field)
+                    log_deletion_success(modeladmin.model, marked_count, request.user)
+
+                    modeladmin.message_user(
+                        request,
+                        format_html(
+                            "Marked <strong>{}</strong> {} as deleted.",
+                            marked_count,
+                            verbose_name if marked_count == 1 else verbose_name_plural
+                        )
+                    )
+                    return None
+
+                deleted_count, deleted_details = delete_in_batches(modeladmin.model)
 
                 # Log successful deletion
                 log_deletion_success(modeladmin.model, deleted_count, request.user)
 
                 # Send success message
+                label = verbose_name if deleted_count == 1 else verbose_name_plural
                 modeladmin.message_user(
                     request,
                     format_html(
                         "Successfully deleted <strong>{}</strong> {}.",
                         deleted_count,
-                        opts.verbose_name_plural if deleted_count != 1 else opts.verbose_name
+                        label
                     )
                 )
+            except BatchDeletionError as e:
+                modeladmin.message_user(
+                    request,
+                    format_html(
+                        "Error during deletion: deleted <strong>{}</strong> of {} {} before failing: "
+                        "<strong>{}</strong>",
+                        e.deleted_count,
+                        object_count,
+                        verbose_name_plural,
+                        str(e)
+                    ),
+                    level='ERROR'
+                )
+                return None
             except Exception as e:
                 modeladmin.message_user(
                     request,
@@ -91,7 +133,7 @@ def delete_all_action(modeladmin, request, queryset):
         else:
             modeladmin.message_user(
                 request,
-                "No %s to delete." % opts.verbose_name_plural
+                "No %s to delete." % verbose_name_plural
             )
 
         # Return None to redirect back to changelist
@@ -99,10 +141,12 @@ def delete_all_action(modeladmin, request, queryset):
 
     # Show confirmation page
     context = {
-        'title': 'Delete all %s' % opts.verbose_name_plural,
-        'object_name': opts.verbose_name,
+        'title': ('Mark all %s as deleted' if soft_delete_field else 'Delete all %s') % verbose_name_plural,
+        'soft_delete_field': soft_delete_field,
+        'object_name': verbose_name,
         'object_count': object_count,
-        'queryset': all_objects,
+        # Only a small sample of pks is needed to resubmit the action
+        'preview_ids': list(all_objects.values_list('pk', flat=True)[:20]),
         'opts': opts,
         'action_checkbox_name': helpers.ACTION_CHECKBOX_NAME,
         'media': modeladmin.media,
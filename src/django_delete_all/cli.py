@@ -3,9 +3,17 @@ import sys
 import re
 import click
 import importlib.util
+from functools import lru_cache
+from itertools import chain, islice
 from pathlib import Path
 
 
+_SETTINGS_RE = re.compile(r'setdefault\(["\']DJANGO_SETTINGS_MODULE["\'],\s*["\']([^"\']+)["\']')
+
+# Directories already checked against (and possibly added to) sys.path
+_INSERTED_PATHS: set = set()
+
+
 @click.group()
 @click.version_option()
 def main():
@@ -19,9 +27,14 @@ def main():
 @click.option('--force', is_flag=True, help='Skip confirmation prompt')
 @click.option('--dry-run', is_flag=True, help='Show what would be deleted without actually deleting')
 @click.option('--production-override', is_flag=True, help='Allow deletion in production (use with extreme caution!)')
+@click.option('--raw', 'raw_delete', is_flag=True,
+              help='Delete with a single DELETE statement, bypassing signals and cascades')
+@click.option('--truncate', is_flag=True, help='Empty the table with TRUNCATE (PostgreSQL) or a plain DELETE')
+@click.option('--fast-count', is_flag=True, help='Skip the up-front count and delete with a single DELETE')
 @click.option('--settings', help='Django settings module (e.g., myproject.settings)')
 @click.option('--verbose', '-v', is_flag=True, help='Verbose output')
-def delete(app_label, model_name, force, dry_run, production_override, settings, verbose):
+def delete(app_label, model_name, force, dry_run, production_override, raw_delete, truncate, fast_count, settings,
+           verbose):
     """Delete all objects from specified model or app.
 
     Examples:
@@ -31,7 +44,8 @@ def delete(app_label, model_name, force, dry_run, production_override, settings,
     """
     try:
         _setup_django(settings, verbose)
-        _run_delete_command(app_label, model_name, force, dry_run, production_override)
+        _run_delete_command(app_label, model_name, force, dry_run, production_override, raw_delete, truncate,
+                            fast_count)
     except Exception as e:
         click.echo(f"Error: {e}", err=True)
         sys.exit(1)
@@ -104,27 +118,16 @@ def init():
     click.echo("✓ Django project detected")
 
     # Try to find settings
-    settings_candidates = [
-        'settings.py',
-        'mysite/settings.py',
-        '*/settings.py'
-    ]
-
-    settings_file = None
-    for candidate in settings_candidates:
-        matches = list(Path('.').glob(candidate))
-        if matches:
-            settings_file = matches[0]
-            break
+    settings_file = _find_settings_file()
 
     if settings_file:
         click.echo(f"✓ Settings file found: {settings_file}")
 
-        # Read settings file
-        content = settings_file.read_text()
+        # Check if already installed, stopping at the first match
+        with settings_file.open('r') as f:
+            installed = any('django_delete_all' in line for line in f)
 
-        # Check if already installed
-        if 'django_delete_all' in content:
+        if installed:
             click.echo("✓ django-delete-all is already installed in INSTALLED_APPS")
         else:
             click.echo("Add 'django_delete_all' to your INSTALLED_APPS in settings.py")
@@ -145,31 +148,6 @@ def init():
     click.echo("\nFor troubleshooting, run: django-delete-all debug")
 
 
-def _setup_django(settings_module=None):
-    """Setup Django environment."""
-    import django
-    from django.conf import settings
-
-    # Try to detect Django settings
-    if not settings_module:
-        settings_module = _detect_django_settings()
-
-        if not settings_module:
-            raise click.ClickException(
-                "Could not find Django settings. Either:\n"
-                "1. Run from your Django project directory, or\n"
-                "2. Use --settings option, or\n"
-                "3. Set DJANGO_SETTINGS_MODULE environment variable"
-            )
-
-    os.environ.setdefault('DJANGO_SETTINGS_MODULE', settings_module)
-
-    try:
-        django.setup()
-    except Exception as e:
-        raise click.ClickException(f"Failed to setup Django: {e}")
-
-
 def _setup_django(settings_module=None, verbose=False):
     """Setup Django environment."""
     import django
@@ -196,17 +174,13 @@ def _setup_django(settings_module=None, verbose=False):
 
     # Add current directory to Python path if it's not already there
     current_dir = str(Path.cwd())
-    if current_dir not in sys.path:
-        sys.path.insert(0, current_dir)
-        if verbose:
-            click.echo(f"Added to Python path: {current_dir}")
+    if _add_to_sys_path(current_dir) and verbose:
+        click.echo(f"Added to Python path: {current_dir}")
 
     # Also check if we need to add the directory containing manage.py
     manage_py_dir = _find_manage_py_directory()
-    if manage_py_dir and str(manage_py_dir) != current_dir and str(manage_py_dir) not in sys.path:
-        sys.path.insert(0, str(manage_py_dir))
-        if verbose:
-            click.echo(f"Added manage.py directory to Python path: {manage_py_dir}")
+    if manage_py_dir and _add_to_sys_path(str(manage_py_dir)) and verbose:
+        click.echo(f"Added manage.py directory to Python path: {manage_py_dir}")
 
     os.environ.setdefault('DJANGO_SETTINGS_MODULE', settings_module)
 
@@ -220,21 +194,47 @@ def _setup_django(settings_module=None, verbose=False):
         raise click.ClickException(f"Failed to setup Django: {e}")
 
 
+def _add_to_sys_path(path):
+    """Prepend a directory to sys.path once; return True if it was added."""
+    if path in _INSERTED_PATHS:
+        return False
+
+    _INSERTED_PATHS.add(path)
+    if path in sys.path:
+        return False
+
+    sys.path.insert(0, path)
+    return True
+
+
 def _find_manage_py_directory():
     """Find the directory containing manage.py."""
-    current_path = Path.cwd()
+    return _find_manage_py_directory_from(Path.cwd())
+
 
+@lru_cache(maxsize=1)
+def _find_manage_py_directory_from(start_path):
     # Check current directory and up to 3 parent directories
-    for i in range(4):
-        manage_py = current_path / 'manage.py'
-        if manage_py.exists():
-            return current_path
+    for path in islice(chain([start_path], start_path.parents), 4):
+        if os.path.isfile(path / 'manage.py'):
+            return path
+
+    return None
+
 
-        # Move up one directory
-        parent = current_path.parent
-        if parent == current_path:  # Reached filesystem root
-            break
-        current_path = parent
+def _find_settings_file():
+    """Find the project's settings.py in the current directory or a package below it."""
+    for candidate in ('settings.py', 'mysite/settings.py'):
+        if os.path.isfile(candidate):
+            return Path(candidate)
+
+    # Only look one level down, skipping hidden and private directories
+    with os.scandir('.') as entries:
+        for entry in entries:
+            if entry.is_dir() and not entry.name.startswith(('.', '_')):
+                candidate = Path(entry.name) / 'settings.py'
+                if candidate.is_file():
+                    return candidate
 
     return None
 
@@ -255,7 +255,7 @@ def _detect_django_settings():
             content = manage_py.read_text()
 
             # Look for os.environ.setdefault in manage.py
-            match = re.search(r'setdefault\(["\']DJANGO_SETTINGS_MODULE["\'],\s*["\']([^"\']+)["\']', content)
+            match = 'DJANGO_SETTINGS_MODULE' in content and _SETTINGS_RE.search(content)
             if match:
                 settings_module = match.group(1)
                 return settings_module
@@ -286,20 +286,23 @@ def _detect_django_settings():
 
 def _test_settings_module(module_name):
     """Test if a settings module exists and is importable."""
-    try:
-        # Make sure current directory is in path
-        current_dir = str(Path.cwd())
-        if current_dir not in sys.path:
-            sys.path.insert(0, current_dir)
+    # Make sure current directory is in path
+    _add_to_sys_path(str(Path.cwd()))
+
+    return _test_settings_module_cached(module_name, tuple(sys.path))
 
-        import importlib
+
+@lru_cache(maxsize=64)
+def _test_settings_module_cached(module_name, path_key):
+    try:
         spec = importlib.util.find_spec(module_name)
         return spec is not None
     except (ImportError, ModuleNotFoundError, ValueError):
         return False
 
 
-def _run_delete_command(app_label, model_name, force, dry_run, production_override):
+def _run_delete_command(app_label, model_name, force, dry_run, production_override, raw_delete=False,
+                        truncate=False, fast_count=False):
     """Run the delete command using Django's management system."""
     from django.core.management import call_command
 
@@ -311,6 +314,9 @@ def _run_delete_command(app_label, model_name, force, dry_run, production_overri
         'force': force,
         'dry_run': dry_run,
         'production_override': production_override,
+        'raw_delete': raw_delete,
+        'truncate': truncate,
+        'fast_count': fast_count,
     }
 
     call_command('delete_all', *args, **options)
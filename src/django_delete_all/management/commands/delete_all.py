@@ -1,13 +1,18 @@
 import os
 from django.core.management.base import BaseCommand, CommandError
 from django.apps import apps
-from django.db import transaction
+from django.core.exceptions import ImproperlyConfigured
+from django.db import connections, router, transaction
 from django.conf import settings
 
 
 class Command(BaseCommand):
     help = 'Delete all objects from specified model or app'
 
+    # Substrings of the database name that indicate production
+    _PROD_MARKERS = ('prod', 'production')
+    _safe_env = None
+
     def add_arguments(self, parser):
         parser.add_argument(
             'app_label',
@@ -35,6 +40,25 @@ class Command(BaseCommand):
             action='store_true',
             help='Allow deletion in production (use with extreme caution!)'
         )
+        parser.add_argument(
+            '--raw',
+            action='store_true',
+            dest='raw_delete',
+            help='Delete with a single DELETE statement, bypassing signals and cascades '
+                 '(requires ALLOW_RAW_DELETE)'
+        )
+        parser.add_argument(
+            '--truncate',
+            action='store_true',
+            help='Empty the table with TRUNCATE (PostgreSQL) or a plain DELETE, bypassing signals '
+                 '(requires ALLOW_TRUNCATE)'
+        )
+        parser.add_argument(
+            '--fast-count',
+            action='store_true',
+            help='Skip the up-front count and delete with a single DELETE, using its row count '
+                 '(models without relations or delete signals only)'
+        )
 
     def handle(self, *args, **options):
         app_label = options['app_label']
@@ -42,6 +66,12 @@ class Command(BaseCommand):
         force = options['force']
         dry_run = options['dry_run']
         production_override = options['production_override']
+        raw_delete = options['raw_delete']
+        truncate = options['truncate']
+        fast_count = options['fast_count']
+
+        if sum([raw_delete, truncate, fast_count]) > 1:
+            raise CommandError("--raw, --truncate and --fast-count cannot be used together.")
 
         # Safety check: prevent accidental production usage
         if not self._is_safe_environment() and not production_override:
@@ -70,19 +100,39 @@ class Command(BaseCommand):
                 f'Run command without model name to see available models.'
             )
 
-        # Get objects count
-        object_count = model.objects.count()
+        # Count and delete in one statement; dry runs still need the count
+        if fast_count and not dry_run:
+            self._delete_with_fast_count(model, force)
+            return
+
+        from django_delete_all.safety import get_soft_delete_field, soft_delete_queryset
+
+        # Explicit --raw/--truncate/--fast-count always delete for real
+        soft_delete_field = None
+        if not (raw_delete or truncate or fast_count):
+            try:
+                soft_delete_field = get_soft_delete_field(model)
+            except ImproperlyConfigured as e:
+                raise CommandError(str(e))
+
+        # Get objects count (only rows not yet marked when soft deleting)
+        if soft_delete_field:
+            object_count = soft_delete_queryset(model, soft_delete_field).count()
+            action = 'mark as deleted'
+        else:
+            object_count = model.objects.count()
+            action = 'delete'
 
         if object_count == 0:
             self.stdout.write(
-                self.style.WARNING(f'No {model._meta.verbose_name_plural} found to delete.')
+                self.style.WARNING(f'No {model._meta.verbose_name_plural} found to {action}.')
             )
             return
 
         # Show what will be deleted
         self.stdout.write(
             self.style.WARNING(
-                f'Found {object_count} {model._meta.verbose_name_plural} to delete.'
+                f'Found {object_count} {model._meta.verbose_name_plural} to {action}.'
             )
         )
 
@@ -94,10 +144,17 @@ class Command(BaseCommand):
 
         # Confirmation
         if not force:
-            confirm = input(
-                f'Are you sure you want to delete ALL {object_count} '
-                f'{model._meta.verbose_name_plural}? This cannot be undone! (yes/no): '
-            )
+            if soft_delete_field:
+                prompt = (
+                    f'Are you sure you want to mark ALL {object_count} {model._meta.verbose_name_plural} '
+                    f'as deleted ({soft_delete_field})? Related objects will not be touched. (yes/no): '
+                )
+            else:
+                prompt = (
+                    f'Are you sure you want to delete ALL {object_count} '
+                    f'{model._meta.verbose_name_plural}? This cannot be undone! (yes/no): '
+                )
+            confirm = input(prompt)
             if confirm.lower() != 'yes':
                 self.stdout.write(self.style.SUCCESS('Operation cancelled.'))
                 return
@@ -105,11 +162,43 @@ class Command(BaseCommand):
         # Perform deletion
         try:
             # Final safety check
-            from django_delete_all.safety import check_deletion_safety, SafetyError
+            from django_delete_all.safety import (
+                BatchDeletionError, check_deletion_safety, check_raw_delete_safety, check_truncate_safety,
+                delete_in_batches, log_deletion_attempt, log_deletion_success, raw_delete_model, soft_delete_model,
+                truncate_model, SafetyError
+            )
             check_deletion_safety(model, object_count)
 
-            with transaction.atomic():
-                deleted_count, deleted_details = model.objects.all().delete()
+            if soft_delete_field:
+                marked_count = soft_delete_model(model, soft_delete_field)
+                log_deletion_success(model, marked_count)
+
+                self.stdout.write(
+                    self.style.SUCCESS(
+                        f'Marked {marked_count} {model._meta.verbose_name_plural} as deleted '
+                        f'({soft_delete_field}). Related objects were not touched.'
+                    )
+                )
+                return
+
+            if raw_delete:
+                check_raw_delete_safety(model)
+                log_deletion_attempt(model, object_count, raw=True)
+
+                deleted_count = raw_delete_model(model)
+                deleted_details = {model._meta.label: deleted_count}
+            elif truncate:
+                check_truncate_safety(model)
+                log_deletion_attempt(model, object_count, raw=True)
+
+                deleted_count = truncate_model(model)
+                if deleted_count is None:
+                    deleted_count = object_count
+                deleted_details = {model._meta.label: deleted_count}
+            else:
+                deleted_count, deleted_details = delete_in_batches(model)
+
+            log_deletion_success(model, deleted_count)
 
             self.stdout.write(
                 self.style.SUCCESS(
@@ -118,11 +207,16 @@ class Command(BaseCommand):
             )
 
             # Show deletion details if verbose
-            if self.verbosity > 1:
-                for model_name, count in deleted_details.items():
-                    if count > 0:
-                        self.stdout.write(f'  - {model_name}: {count}')
+            if options['verbosity'] > 1:
+                lines = [f'  - {label}: {count}' for label, count in deleted_details.items() if count > 0]
+                if lines:
+                    self.stdout.write('\n'.join(lines))
 
+        except BatchDeletionError as e:
+            raise CommandError(
+                f'Error during deletion: deleted {e.deleted_count} of {object_count} '
+                f'{model._meta.verbose_name_plural} before failing: {e}'
+            )
         except SafetyError as e:
             raise CommandError(
                 f'Deletion blocked for safety: {e}\n\n'
@@ -131,34 +225,116 @@ class Command(BaseCommand):
         except Exception as e:
             raise CommandError(f'Error during deletion: {e}')
 
+    def _delete_with_fast_count(self, model, force):
+        """Delete all objects with a single DELETE, taking the count from its row count."""
+        from django_delete_all.safety import (
+            check_deletion_safety, check_fast_count_safety, delete_with_count, log_deletion_attempt,
+            log_deletion_success, SafetyError
+        )
+        verbose_name_plural = model._meta.verbose_name_plural
+
+        try:
+            # Exclusions can be checked before knowing the count
+            check_deletion_safety(model, 0)
+            check_fast_count_safety(model)
+        except SafetyError as e:
+            raise CommandError(f'Deletion blocked for safety: {e}')
+
+        if not force:
+            confirm = input(
+                f'Are you sure you want to delete ALL {verbose_name_plural}? '
+                f'This cannot be undone! (yes/no): '
+            )
+            if confirm.lower() != 'yes':
+                self.stdout.write(self.style.SUCCESS('Operation cancelled.'))
+                return
+
+        try:
+            with transaction.atomic(using=router.db_for_write(model)):
+                deleted_count = delete_with_count(model)
+                # The count is only known now; signals and cascades were bypassed
+                log_deletion_attempt(model, deleted_count, raw=True)
+
+                # Raising here rolls the DELETE back if it exceeded the limits
+                check_deletion_safety(model, deleted_count)
+        except SafetyError as e:
+            raise CommandError(
+                f'Deletion blocked for safety: {e}\n\n'
+                'No objects were deleted. To adjust safety limits, modify DJANGO_DELETE_ALL settings '
+                'in your Django configuration.'
+            )
+        except Exception as e:
+            raise CommandError(f'Error during deletion: {e}')
+
+        log_deletion_success(model, deleted_count)
+
+        if deleted_count == 0:
+            self.stdout.write(self.style.WARNING(f'No {verbose_name_plural} found to delete.'))
+        else:
+            self.stdout.write(self.style.SUCCESS(f'Successfully deleted {deleted_count} {verbose_name_plural}.'))
+
     def _list_models(self, app_config):
         """List all models in the app."""
-        models = app_config.get_models()
+        models = list(app_config.get_models())
         if not models:
             self.stdout.write(f'No models found in app "{app_config.label}".')
             return
 
+        estimates = self._estimate_counts(models)
+
         self.stdout.write(f'Available models in "{app_config.label}":')
         for model in models:
-            count = model.objects.count()
+            if model in estimates:
+                count = f'~{estimates[model]}'
+            else:
+                count = model.objects.count()
             self.stdout.write(
                 f'  - {model.__name__} ({count} objects)'
             )
 
+    def _estimate_counts(self, models):
+        """Approximate row counts from pg_class, fetched in one query per PostgreSQL database."""
+        tables_by_db = {}
+        for model in models:
+            using = router.db_for_read(model)
+            if connections[using].vendor == 'postgresql':
+                tables_by_db.setdefault(using, {})[model._meta.db_table] = model
+
+        estimates = {}
+        for using, tables in tables_by_db.items():
+            with connections[using].cursor() as cursor:
+                cursor.execute(
+                    'SELECT relname, reltuples::bigint FROM pg_class '
+                    'WHERE relname = ANY(%s) AND pg_table_is_visible(oid)',
+                    [list(tables)]
+                )
+                for table, reltuples in cursor.fetchall():
+                    # Never-analyzed tables report -1 (PostgreSQL 14+) or 0 (older
+                    # versions, even with rows present); count those exactly
+                    if reltuples > 0:
+                        estimates[tables[table]] = reltuples
+
+        return estimates
+
     def _is_safe_environment(self):
         """Check if we're in a safe environment for deletion."""
-        # Check DEBUG setting
-        if hasattr(settings, 'DEBUG') and not settings.DEBUG:
-            return False
+        if self._safe_env is None:
+            self._safe_env = self._check_safe_environment()
+        return self._safe_env
 
+    def _check_safe_environment(self):
         # Check environment variables
         env = os.environ.get('DJANGO_ENV', '').lower()
         if env in ['production', 'prod']:
             return False
 
+        # Check DEBUG setting
+        if hasattr(settings, 'DEBUG') and not settings.DEBUG:
+            return False
+
         # Check database name (common production indicators)
-        db_name = settings.DATABASES.get('default', {}).get('NAME', '')
-        if any(indicator in str(db_name).lower() for indicator in ['prod', 'production']):
+        db_name = str(settings.DATABASES.get('default', {}).get('NAME', '')).lower()
+        if any(marker in db_name for marker in self._PROD_MARKERS):
             return False
 
-        return True
\ No newline at end of file
+        return True
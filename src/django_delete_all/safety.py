@@ -1,13 +1,55 @@
 import os
 import logging
+from collections import Counter
 from django.conf import settings
+from django.core.exceptions import FieldDoesNotExist, ImproperlyConfigured
+from django.db import connections, models, router
+from django.db.models.signals import post_delete, pre_delete
+from django.utils import timezone
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_EXCLUDED_APPS = frozenset([
+    'auth',
+    'admin',
+    'contenttypes',
+    'sessions',
+    'messages',
+    'staticfiles',
+])
+
+
+def _is_valid_batch_size(batch_size):
+    return isinstance(batch_size, int) and not isinstance(batch_size, bool) and batch_size >= 1
+
+
+def _validate_batch_size(batch_size):
+    """Ensure DELETE_BATCH_SIZE is a positive integer."""
+    if not _is_valid_batch_size(batch_size):
+        raise ImproperlyConfigured(
+            f"DJANGO_DELETE_ALL['DELETE_BATCH_SIZE'] must be an integer >= 1, got {batch_size!r}"
+        )
+    return batch_size
+
 
 class SafetyConfig:
     """Configuration for django-delete-all safety features."""
 
+    __slots__ = (
+        'enabled',
+        'production_enabled',
+        'excluded_apps',
+        'excluded_models',
+        'max_objects_without_confirmation',
+        'require_confirmation_above',
+        'audit_deletions',
+        'backup_before_delete',
+        'delete_batch_size',
+        'allow_raw_delete',
+        'allow_truncate',
+        'soft_delete_field',
+    )
+
     def __init__(self):
         self.load_settings()
 
@@ -18,19 +60,16 @@ class SafetyConfig:
         # Default safety settings
         self.enabled = django_delete_all_settings.get('ENABLED', True)
         self.production_enabled = django_delete_all_settings.get('PRODUCTION_ENABLED', False)
-        self.excluded_apps = set(django_delete_all_settings.get('EXCLUDED_APPS', [
-            'auth',
-            'admin',
-            'contenttypes',
-            'sessions',
-            'messages',
-            'staticfiles',
-        ]))
-        self.excluded_models = set(django_delete_all_settings.get('EXCLUDED_MODELS', []))
+        self.excluded_apps = frozenset(django_delete_all_settings.get('EXCLUDED_APPS', DEFAULT_EXCLUDED_APPS))
+        self.excluded_models = frozenset(django_delete_all_settings.get('EXCLUDED_MODELS', ()))
         self.max_objects_without_confirmation = django_delete_all_settings.get('MAX_OBJECTS_WITHOUT_CONFIRMATION', 100)
         self.require_confirmation_above = django_delete_all_settings.get('REQUIRE_CONFIRMATION_ABOVE', 10)
         self.audit_deletions = django_delete_all_settings.get('AUDIT_DELETIONS', True)
         self.backup_before_delete = django_delete_all_settings.get('BACKUP_BEFORE_DELETE', False)
+        self.delete_batch_size = _validate_batch_size(django_delete_all_settings.get('DELETE_BATCH_SIZE', 1000))
+        self.allow_raw_delete = django_delete_all_settings.get('ALLOW_RAW_DELETE', False)
+        self.allow_truncate = django_delete_all_settings.get('ALLOW_TRUNCATE', False)
+        self.soft_delete_field = django_delete_all_settings.get('SOFT_DELETE_FIELD', None)
 
         # Environment-based overrides
         self._apply_environment_overrides()
@@ -58,7 +97,7 @@ class SafetyConfig:
             return False, "django-delete-all is disabled"
 
         app_label = model._meta.app_label
-        model_name = f"{app_label}.{model.__name__}"
+        model_name = model._meta.label
 
         if app_label in self.excluded_apps:
             return False, f"App '{app_label}' is in excluded apps list"
@@ -99,28 +138,238 @@ def check_deletion_safety(model, object_count):
     return True
 
 
-def log_deletion_attempt(model, object_count, user=None):
+def has_delete_listeners(model):
+    """Check if a model has pre_delete/post_delete receivers."""
+    return pre_delete.has_listeners(model) or post_delete.has_listeners(model)
+
+
+def has_relations(model):
+    """Check if deleting a model's rows could affect rows in other tables.
+
+    Covers the relations Django knows about: reverse relations (including
+    hidden ones declared with related_name='+'), M2M through tables,
+    generic relations and multi-table inheritance parents. Foreign keys
+    from tables outside Django's models are not detected.
+    """
+    opts = model._meta
+    # related_objects leaves out hidden reverse relations, get_fields() does not
+    reverse_relations = [
+        field for field in opts.get_fields(include_hidden=True)
+        if field.auto_created and not field.concrete
+    ]
+    return bool(
+        opts.parents
+        or reverse_relations
+        or opts.many_to_many
+        or any(field.is_relation for field in opts.private_fields)
+    )
+
+
+def check_raw_delete_safety(model):
+    """Safety check for raw deletions, which bypass signals and cascades."""
+    if not safety.allow_raw_delete:
+        raise SafetyError(
+            "Raw deletion not allowed: set ALLOW_RAW_DELETE in DJANGO_DELETE_ALL settings to enable it"
+        )
+
+    if has_delete_listeners(model):
+        raise SafetyError(
+            f"Raw deletion not allowed: {model._meta.label} has pre_delete/post_delete receivers"
+        )
+
+    return True
+
+
+def check_truncate_safety(model):
+    """Safety check for truncation, which bypasses signals and cascades."""
+    if not safety.allow_truncate:
+        raise SafetyError(
+            "Truncation not allowed: set ALLOW_TRUNCATE in DJANGO_DELETE_ALL settings to enable it"
+        )
+
+    if has_delete_listeners(model):
+        raise SafetyError(
+            f"Truncation not allowed: {model._meta.label} has pre_delete/post_delete receivers"
+        )
+
+    if has_relations(model):
+        raise SafetyError(
+            f"Truncation not allowed: {model._meta.label} has related models"
+        )
+
+    return True
+
+
+def check_fast_count_safety(model):
+    """Safety check for counted single-statement deletes, which bypass the collector."""
+    if has_delete_listeners(model):
+        raise SafetyError(
+            f"Fast-count deletion not allowed: {model._meta.label} has pre_delete/post_delete receivers"
+        )
+
+    if has_relations(model):
+        raise SafetyError(
+            f"Fast-count deletion not allowed: {model._meta.label} has related models"
+        )
+
+    return True
+
+
+def truncate_model(model):
+    """Empty a model's table with a single SQL statement.
+
+    Uses TRUNCATE on PostgreSQL and a plain DELETE elsewhere. Returns the
+    number of deleted rows, or None when the backend does not report it.
+
+    TRUNCATE is deliberately issued without CASCADE: if another table still
+    references this one, PostgreSQL raises instead of emptying that table.
+    """
+    connection = connections[router.db_for_write(model)]
+    if connection.vendor != 'postgresql':
+        return delete_with_count(model)
+
+    table = connection.ops.quote_name(model._meta.db_table)
+    with connection.cursor() as cursor:
+        cursor.execute(f'TRUNCATE TABLE {table} RESTART IDENTITY')
+    return None
+
+
+def delete_with_count(model):
+    """Delete all rows of a model's table with one DELETE and return how many were removed."""
+    connection = connections[router.db_for_write(model)]
+    table = connection.ops.quote_name(model._meta.db_table)
+
+    with connection.cursor() as cursor:
+        cursor.execute(f'DELETE FROM {table}')
+        return cursor.rowcount
+
+
+def raw_delete_model(model):
+    """Delete all objects of a model with a single DELETE statement.
+
+    Skips Django's collector entirely, so no signals are sent and cascades
+    are left to the database (ON DELETE CASCADE).
+    """
+    queryset = model.objects.all()
+    # A single statement, so no explicit transaction is needed
+    return queryset._raw_delete(queryset.db)
+
+
+def get_soft_delete_field(model):
+    """Return the configured soft delete field if the model has it, else None."""
+    field_name = safety.soft_delete_field
+    if not field_name:
+        return None
+
+    try:
+        field = model._meta.get_field(field_name)
+    except FieldDoesNotExist:
+        return None
+
+    # DateTimeField is a DateField subclass
+    if not isinstance(field, models.DateField):
+        raise ImproperlyConfigured(
+            f"DJANGO_DELETE_ALL['SOFT_DELETE_FIELD'] must name a date or datetime field, "
+            f"but {model._meta.label}.{field_name} is a {type(field).__name__}"
+        )
+
+    return field_name
+
+
+def soft_delete_queryset(model, field_name):
+    """Return the objects of a model that are not marked as deleted yet."""
+    return model.objects.filter(**{f'{field_name}__isnull': True})
+
+
+def soft_delete_model(model, field_name):
+    """Mark all objects of a model as deleted with a single UPDATE.
+
+    Related objects are not cascaded; purging marked rows is left to the
+    caller (e.g. a background job).
+    """
+    field = model._meta.get_field(field_name)
+    now = timezone.now() if isinstance(field, models.DateTimeField) else timezone.localdate()
+    return soft_delete_queryset(model, field_name).update(**{field_name: now})
+
+
+def delete_in_batches(model, batch_size=None):
+    """Delete all objects of a model in primary key batches.
+
+    Keeps memory bounded on large tables, since Django's collector only
+    has to load one batch (and its cascades) at a time.
+    """
+    if batch_size is None:
+        batch_size = safety.delete_batch_size
+    elif not _is_valid_batch_size(batch_size):
+        raise ValueError(f"batch_size must be an integer >= 1, got {batch_size!r}")
+
+    # Each batch is sent as pk__in parameters; stay under the backend's limit
+    max_query_params = connections[router.db_for_write(model)].features.max_query_params
+    if max_query_params:
+        batch_size = min(batch_size, max_query_params)
+
+    total_deleted = 0
+    deleted_details = Counter()
+
+    while True:
+        batch_ids = list(model.objects.values_list('pk', flat=True)[:batch_size])
+        if not batch_ids:
+            break
+
+        # QuerySet.delete() runs the collector in its own transaction, so
+        # earlier batches stay deleted if a later one fails
+        try:
+            count, details = model.objects.filter(pk__in=batch_ids).delete()
+        except Exception as e:
+            raise BatchDeletionError(deleted_details[model._meta.label], e) from e
+
+        total_deleted += count
+        deleted_details.update(details)
+
+        # Guard against a custom delete() that leaves the rows in place
+        if not details.get(model._meta.label):
+            break
+
+    return total_deleted, dict(deleted_details)
+
+
+def log_deletion_attempt(model, object_count, user=None, raw=False):
     """Log deletion attempts for audit purposes."""
     if not safety.audit_deletions:
         return
 
     logger.info(
-        f"Deletion attempt: {model._meta.label} "
-        f"({object_count} objects) by {user or 'CLI'}"
+        "Deletion attempt: %s (%d objects) by %s",
+        model._meta.label, object_count, user or 'CLI'
     )
 
+    if raw:
+        logger.warning(
+            "Raw deletion of %s: delete signals and cascades are bypassed",
+            model._meta.label
+        )
+
 
 def log_deletion_success(model, deleted_count, user=None):
     """Log successful deletions for audit purposes."""
-    if not safety.audit_deletions:
+    if not safety.audit_deletions or not logger.isEnabledFor(logging.INFO):
         return
 
     logger.info(
-        f"Deletion completed: {model._meta.label} "
-        f"({deleted_count} objects deleted) by {user or 'CLI'}"
+        "Deletion completed: %s (%d objects deleted) by %s",
+        model._meta.label, deleted_count, user or 'CLI'
     )
 
 
 class SafetyError(Exception):
     """Exception raised when safety checks fail."""
-    pass
\ No newline at end of file
+
+    __slots__ = ()
+
+
+class BatchDeletionError(Exception):
+    """Exception raised when a batch fails after earlier batches were deleted."""
+
+    def __init__(self, deleted_count, error):
+        super().__init__(str(error))
+        self.deleted_count = deleted_count
@@ -1,6 +1,11 @@
 from django.contrib import admin
-from .models import TestModel
+from .models import SoftDeleteModel, TestModel
 
 @admin.register(TestModel)
 class TestModelAdmin(admin.ModelAdmin):
     list_display = ['name', 'description']
+
+
+@admin.register(SoftDeleteModel)
+class SoftDeleteModelAdmin(admin.ModelAdmin):
+    list_display = ['name', 'deleted_at']
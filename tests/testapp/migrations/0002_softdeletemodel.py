@@ -0,0 +1,21 @@
+# Generated by Django 4.2.30 on 2026-10-14 06:51
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('testapp', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SoftDeleteModel',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100)),
+                ('deleted_at', models.DateTimeField(blank=True, null=True)),
+            ],
+        ),
+    ]
@@ -6,3 +6,11 @@ class TestModel(models.Model):
 
     def __str__(self):
         return self.name
+
+
+class SoftDeleteModel(models.Model):
+    name = models.CharField(max_length=100)
+    deleted_at = models.DateTimeField(null=True, blank=True)
+
+    def __str__(self):
+        return self.name
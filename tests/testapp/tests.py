@@ -0,0 +1,430 @@
+from io import StringIO
+from unittest import mock
+
+from django.core.exceptions import ImproperlyConfigured
+from django.core.management import call_command, CommandError
+from django.db import connection, models
+from django.db.models.signals import pre_delete
+from django.contrib.auth.models import User
+from django.test import override_settings, TestCase, TransactionTestCase
+from django.test.utils import isolate_apps
+from django.utils import timezone
+
+from django_delete_all.safety import (
+    check_deletion_safety, check_fast_count_safety, check_truncate_safety, delete_in_batches, has_relations,
+    safety, SafetyConfig, SafetyError
+)
+from testapp.models import SoftDeleteModel, TestModel
+
+
+def run_delete_all(*args, **options):
+    """Run delete_all non-interactively; the test runner forces DEBUG=False."""
+    options.setdefault('force', True)
+    options.setdefault('production_override', True)
+    call_command('delete_all', 'testapp', *args, stdout=StringIO(), **options)
+
+
+class SafetyConfigTests(TestCase):
+    def test_disabling_at_runtime_blocks_deletion(self):
+        check_deletion_safety(TestModel, 1)
+
+        with mock.patch.object(safety, 'enabled', False):
+            with self.assertRaisesMessage(SafetyError, 'django-delete-all is disabled'):
+                check_deletion_safety(TestModel, 1)
+
+        check_deletion_safety(TestModel, 1)
+
+    def test_excluded_models_changes_take_effect(self):
+        with mock.patch.object(safety, 'excluded_models', frozenset(['testapp.TestModel'])):
+            with self.assertRaisesMessage(SafetyError, "Model 'testapp.TestModel' is in excluded models list"):
+                check_deletion_safety(TestModel, 1)
+
+    def test_enforced_limit_matches_config(self):
+        with mock.patch.object(safety, 'max_objects_without_confirmation', 5):
+            check_deletion_safety(TestModel, 5)
+            with self.assertRaisesMessage(SafetyError, 'Maximum allowed: 5'):
+                check_deletion_safety(TestModel, 6)
+
+
+class DeleteInBatchesTests(TestCase):
+    def setUp(self):
+        TestModel.objects.bulk_create([TestModel(name=str(i)) for i in range(5)])
+
+    def test_deletes_all_objects_across_batches(self):
+        deleted_count, deleted_details = delete_in_batches(TestModel, batch_size=2)
+
+        self.assertEqual(deleted_count, 5)
+        self.assertEqual(deleted_details, {'testapp.TestModel': 5})
+        self.assertFalse(TestModel.objects.exists())
+
+    def test_invalid_batch_size_is_rejected(self):
+        for batch_size in (0, -1, True, '10'):
+            with self.subTest(batch_size=batch_size):
+                with self.assertRaises(ValueError):
+                    delete_in_batches(TestModel, batch_size=batch_size)
+
+        self.assertEqual(TestModel.objects.count(), 5)
+
+    def test_invalid_batch_size_setting_is_rejected(self):
+        with override_settings(DJANGO_DELETE_ALL={'DELETE_BATCH_SIZE': 0}):
+            with self.assertRaisesMessage(ImproperlyConfigured, 'DELETE_BATCH_SIZE'):
+                SafetyConfig()
+
+    def test_stops_when_a_batch_deletes_nothing(self):
+        with mock.patch('django.db.models.query.QuerySet.delete', return_value=(0, {})):
+            deleted_count, deleted_details = delete_in_batches(TestModel, batch_size=2)
+
+        self.assertEqual((deleted_count, deleted_details), (0, {}))
+        self.assertEqual(TestModel.objects.count(), 5)
+
+    def test_batch_size_is_capped_by_query_params_limit(self):
+        with mock.patch.object(connection.features, 'max_query_params', 2):
+            # Three batches (SELECT + DELETE each) and a final empty SELECT
+            with self.assertNumQueries(7):
+                deleted_count, _ = delete_in_batches(TestModel, batch_size=1000)
+
+        self.assertEqual(deleted_count, 5)
+
+
+class BatchFailureTests(TransactionTestCase):
+    """Each batch commits on its own, so failures need real transactions."""
+
+    def setUp(self):
+        TestModel.objects.bulk_create([TestModel(name=str(i)) for i in range(5)])
+
+    def test_failure_reports_objects_deleted_by_earlier_batches(self):
+        last_pk = TestModel.objects.order_by('pk').last().pk
+
+        def receiver(instance, **kwargs):
+            if instance.pk == last_pk:
+                raise RuntimeError('receiver failed')
+
+        pre_delete.connect(receiver, sender=TestModel)
+        self.addCleanup(pre_delete.disconnect, receiver, sender=TestModel)
+
+        with mock.patch.object(safety, 'delete_batch_size', 2):
+            with self.assertRaisesMessage(
+                CommandError, 'deleted 4 of 5 test models before failing: receiver failed'
+            ):
+                run_delete_all('TestModel')
+
+        self.assertEqual(list(TestModel.objects.values_list('pk', flat=True)), [last_pk])
+
+    def test_admin_failure_reports_objects_deleted_by_earlier_batches(self):
+        last_pk = TestModel.objects.order_by('pk').last().pk
+
+        def receiver(instance, **kwargs):
+            if instance.pk == last_pk:
+                raise RuntimeError('receiver failed')
+
+        pre_delete.connect(receiver, sender=TestModel)
+        self.addCleanup(pre_delete.disconnect, receiver, sender=TestModel)
+
+        User.objects.create_superuser('admin', 'admin@example.com', 'password')
+        self.client.login(username='admin', password='password')
+
+        with mock.patch.object(safety, 'delete_batch_size', 2):
+            response = self.client.post(
+                '/admin/testapp/testmodel/',
+                {'action': 'delete_all_action', '_selected_action': [last_pk], 'post': 'yes'},
+                follow=True
+            )
+
+        self.assertContains(response, 'deleted <strong>4</strong> of 5 test models before failing')
+
+
+class RawDeleteTests(TestCase):
+    def setUp(self):
+        TestModel.objects.bulk_create([TestModel(name=str(i)) for i in range(5)])
+
+    def test_refused_unless_allowed(self):
+        with self.assertRaisesMessage(CommandError, 'set ALLOW_RAW_DELETE'):
+            run_delete_all('TestModel', raw_delete=True)
+
+        self.assertEqual(TestModel.objects.count(), 5)
+
+    @mock.patch.object(safety, 'allow_raw_delete', True)
+    def test_refused_with_delete_receivers(self):
+        def receiver(**kwargs):
+            pass
+
+        pre_delete.connect(receiver, sender=TestModel)
+        self.addCleanup(pre_delete.disconnect, receiver, sender=TestModel)
+
+        with self.assertRaisesMessage(CommandError, 'has pre_delete/post_delete receivers'):
+            run_delete_all('TestModel', raw_delete=True)
+
+        self.assertEqual(TestModel.objects.count(), 5)
+
+    @mock.patch.object(safety, 'allow_raw_delete', True)
+    def test_deletes_all_objects(self):
+        run_delete_all('TestModel', raw_delete=True)
+
+        self.assertFalse(TestModel.objects.exists())
+
+
+class HasRelationsTests(TestCase):
+    def test_plain_model(self):
+        self.assertFalse(has_relations(TestModel))
+
+    @isolate_apps('testapp')
+    def test_foreign_key_target(self):
+        class Author(models.Model):
+            class Meta:
+                app_label = 'testapp'
+
+        class Book(models.Model):
+            author = models.ForeignKey(Author, models.CASCADE)
+
+            class Meta:
+                app_label = 'testapp'
+
+        self.assertTrue(has_relations(Author))
+
+    @isolate_apps('testapp')
+    def test_hidden_foreign_key_target(self):
+        class Target(models.Model):
+            class Meta:
+                app_label = 'testapp'
+
+        class Ref(models.Model):
+            target = models.ForeignKey(Target, models.CASCADE, related_name='+')
+
+            class Meta:
+                app_label = 'testapp'
+
+        self.assertFalse(Target._meta.related_objects)
+        self.assertTrue(has_relations(Target))
+
+    @isolate_apps('testapp')
+    def test_many_to_many(self):
+        class Tag(models.Model):
+            class Meta:
+                app_label = 'testapp'
+
+        class Post(models.Model):
+            tags = models.ManyToManyField(Tag)
+
+            class Meta:
+                app_label = 'testapp'
+
+        self.assertTrue(has_relations(Post))
+        self.assertTrue(has_relations(Tag))
+
+    @isolate_apps('testapp')
+    def test_multi_table_inheritance(self):
+        class Parent(models.Model):
+            class Meta:
+                app_label = 'testapp'
+
+        class Child(Parent):
+            class Meta:
+                app_label = 'testapp'
+
+        self.assertTrue(has_relations(Parent))
+        self.assertTrue(has_relations(Child))
+
+
+class TruncateTests(TestCase):
+    def setUp(self):
+        TestModel.objects.bulk_create([TestModel(name=str(i)) for i in range(5)])
+
+    def test_refused_unless_allowed(self):
+        with self.assertRaisesMessage(CommandError, 'set ALLOW_TRUNCATE'):
+            run_delete_all('TestModel', truncate=True)
+
+        self.assertEqual(TestModel.objects.count(), 5)
+
+    @mock.patch.object(safety, 'allow_truncate', True)
+    def test_refused_with_delete_receivers(self):
+        def receiver(**kwargs):
+            pass
+
+        pre_delete.connect(receiver, sender=TestModel)
+        self.addCleanup(pre_delete.disconnect, receiver, sender=TestModel)
+
+        with self.assertRaisesMessage(CommandError, 'has pre_delete/post_delete receivers'):
+            run_delete_all('TestModel', truncate=True)
+
+        self.assertEqual(TestModel.objects.count(), 5)
+
+    @isolate_apps('testapp')
+    @mock.patch.object(safety, 'allow_truncate', True)
+    def test_refused_for_multi_table_inheritance_child(self):
+        class Parent(models.Model):
+            class Meta:
+                app_label = 'testapp'
+
+        class Child(Parent):
+            class Meta:
+                app_label = 'testapp'
+
+        with self.assertRaisesMessage(SafetyError, 'testapp.Child has related models'):
+            check_truncate_safety(Child)
+
+    @isolate_apps('testapp')
+    @mock.patch.object(safety, 'allow_truncate', True)
+    def test_refused_for_hidden_foreign_key_target(self):
+        class Target(models.Model):
+            class Meta:
+                app_label = 'testapp'
+
+        class Ref(models.Model):
+            target = models.ForeignKey(Target, models.CASCADE, related_name='+')
+
+            class Meta:
+                app_label = 'testapp'
+
+        with self.assertRaisesMessage(SafetyError, 'testapp.Target has related models'):
+            check_truncate_safety(Target)
+
+    @mock.patch.object(safety, 'allow_truncate', True)
+    def test_deletes_all_objects(self):
+        run_delete_all('TestModel', truncate=True)
+
+        self.assertFalse(TestModel.objects.exists())
+
+
+@mock.patch.object(safety, 'soft_delete_field', 'deleted_at')
+class SoftDeleteTests(TestCase):
+    def setUp(self):
+        self.already_deleted_at = timezone.now() - timezone.timedelta(days=1)
+        SoftDeleteModel.objects.create(name='old', deleted_at=self.already_deleted_at)
+        SoftDeleteModel.objects.bulk_create([SoftDeleteModel(name=str(i)) for i in range(3)])
+
+    def test_marks_only_unmarked_objects(self):
+        stdout = StringIO()
+        call_command(
+            'delete_all', 'testapp', 'SoftDeleteModel', force=True, production_override=True, stdout=stdout
+        )
+
+        output = stdout.getvalue()
+        self.assertIn('Found 3 soft delete models to mark as deleted.', output)
+        self.assertIn('Marked 3 soft delete models as deleted', output)
+        self.assertEqual(SoftDeleteModel.objects.count(), 4)
+        self.assertFalse(SoftDeleteModel.objects.filter(deleted_at__isnull=True).exists())
+        self.assertEqual(SoftDeleteModel.objects.get(name='old').deleted_at, self.already_deleted_at)
+
+    def test_prompt_says_objects_are_marked(self):
+        with mock.patch('builtins.input', return_value='no') as mock_input:
+            run_delete_all('SoftDeleteModel', force=False)
+
+        prompt = mock_input.call_args[0][0]
+        self.assertIn('mark ALL 3 soft delete models as deleted (deleted_at)', prompt)
+        self.assertNotIn('cannot be undone', prompt)
+
+    def test_models_without_the_field_are_deleted(self):
+        TestModel.objects.create(name='x')
+
+        run_delete_all('TestModel')
+
+        self.assertFalse(TestModel.objects.exists())
+
+    def test_explicit_hard_delete_flags_delete(self):
+        with mock.patch.object(safety, 'allow_raw_delete', True):
+            run_delete_all('SoftDeleteModel', raw_delete=True)
+
+        self.assertFalse(SoftDeleteModel.objects.exists())
+
+    def test_non_date_field_is_refused(self):
+        with mock.patch.object(safety, 'soft_delete_field', 'name'):
+            with self.assertRaisesMessage(CommandError, 'must name a date or datetime field'):
+                run_delete_all('SoftDeleteModel')
+
+        self.assertEqual(SoftDeleteModel.objects.filter(deleted_at__isnull=True).count(), 3)
+
+    def test_admin_confirmation_page_says_objects_are_marked(self):
+        User.objects.create_superuser('admin', 'admin@example.com', 'password')
+        self.client.login(username='admin', password='password')
+        pk = SoftDeleteModel.objects.first().pk
+
+        response = self.client.post(
+            '/admin/testapp/softdeletemodel/',
+            {'action': 'delete_all_action', '_selected_action': [pk]}
+        )
+
+        self.assertContains(response, 'mark ALL 3 soft delete models as deleted')
+        self.assertNotContains(response, 'permanently delete')
+
+
+class FastCountDeleteTests(TestCase):
+    def setUp(self):
+        TestModel.objects.bulk_create([TestModel(name=str(i)) for i in range(5)])
+
+    def test_deletes_all_objects_and_logs_them(self):
+        with self.assertLogs('django_delete_all.safety', 'INFO') as logs:
+            run_delete_all('TestModel', fast_count=True)
+
+        self.assertFalse(TestModel.objects.exists())
+        self.assertEqual(logs.output, [
+            'INFO:django_delete_all.safety:Deletion attempt: testapp.TestModel (5 objects) by CLI',
+            'WARNING:django_delete_all.safety:Raw deletion of testapp.TestModel: '
+            'delete signals and cascades are bypassed',
+            'INFO:django_delete_all.safety:Deletion completed: testapp.TestModel (5 objects deleted) by CLI',
+        ])
+
+    @mock.patch.object(safety, 'max_objects_without_confirmation', 4)
+    def test_rolls_back_when_over_the_limit(self):
+        with self.assertRaisesMessage(CommandError, 'Maximum allowed: 4'):
+            run_delete_all('TestModel', fast_count=True)
+
+        self.assertEqual(TestModel.objects.count(), 5)
+
+    def test_refused_with_delete_receivers(self):
+        def receiver(**kwargs):
+            pass
+
+        pre_delete.connect(receiver, sender=TestModel)
+        self.addCleanup(pre_delete.disconnect, receiver, sender=TestModel)
+
+        with self.assertRaisesMessage(CommandError, 'has pre_delete/post_delete receivers'):
+            run_delete_all('TestModel', fast_count=True)
+
+        self.assertEqual(TestModel.objects.count(), 5)
+
+    @isolate_apps('testapp')
+    def test_refused_for_multi_table_inheritance_child(self):
+        class Parent(models.Model):
+            class Meta:
+                app_label = 'testapp'
+
+        class Child(Parent):
+            class Meta:
+                app_label = 'testapp'
+
+        with self.assertRaisesMessage(SafetyError, 'testapp.Child has related models'):
+            check_fast_count_safety(Child)
+
+    @isolate_apps('testapp')
+    def test_refused_for_hidden_foreign_key_target(self):
+        class Target(models.Model):
+            class Meta:
+                app_label = 'testapp'
+
+        class Ref(models.Model):
+            target = models.ForeignKey(Target, models.CASCADE, related_name='+')
+
+            class Meta:
+                app_label = 'testapp'
+
+        with self.assertRaisesMessage(SafetyError, 'testapp.Target has related models'):
+            check_fast_count_safety(Target)
+
+    def test_success_is_logged_on_every_path(self):
+        paths = [{}, {'raw_delete': True}, {'truncate': True}, {'fast_count': True}]
+
+        with mock.patch.object(safety, 'allow_raw_delete', True), \
+                mock.patch.object(safety, 'allow_truncate', True):
+            for options in paths:
+                with self.subTest(**options):
+                    TestModel.objects.bulk_create([TestModel(name=str(i)) for i in range(2)])
+                    object_count = TestModel.objects.count()
+
+                    with self.assertLogs('django_delete_all.safety', 'INFO') as logs:
+                        run_delete_all('TestModel', **options)
+
+                    self.assertIn(
+                        'INFO:django_delete_all.safety:Deletion completed: testapp.TestModel '
+                        f'({object_count} objects deleted) by CLI',
+                        logs.output
+                    )
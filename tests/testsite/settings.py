@@ -161,6 +161,18 @@ DJANGO_DELETE_ALL = {
 
     # Create backup before deletion (future feature)
     'BACKUP_BEFORE_DELETE': False,  # Default: False
+
+    # Number of objects deleted per batch (keeps memory bounded)
+    'DELETE_BATCH_SIZE': 1000,  # Default: 1000
+
+    # Allow --raw deletions, which bypass delete signals and cascades
+    'ALLOW_RAW_DELETE': False,  # Default: False
+
+    # Allow --truncate on models without relations or delete signals
+    'ALLOW_TRUNCATE': False,  # Default: False
+
+    # Date/datetime field set instead of deleting, on models that have it
+    'SOFT_DELETE_FIELD': None,  # Default: None
 }
 
 # For testing with small limits, use: